@@ -1,203 +1,299 @@
 import sqlite3
-import json
+import orjson
+import re
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 import uuid
+import weakref
+import zstandard as zstd
 from typing import Dict, List, Optional
 
+#statements live in module-level constants so the SQL text isn't rebuilt on every call; the connection's statement cache matches them by text
+_SQL_INSERT_SESSION = '''INSERT INTO sessions (session_id, user_id, metadata)
+    VALUES (?, ?, ?)'''
+_SQL_INSERT_RESEARCH_QUERY = '''INSERT INTO research_queries(query_id, session_id, original_query, generated_queries)
+    VALUES (?, ?, ?, ?)'''
+_SQL_INSERT_RESEARCH_STRUCTURE = '''INSERT INTO research_structure(structure_id, query_id, session_id, structure_data)
+    VALUES (?, ?, ?, ?)'''
+_SQL_INSERT_WORKER_RESULT = '''INSERT INTO worker_results
+    (result_id, structure_id, session_id, worker_type, queries, raw_summaries, compiled_result, processing_time)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)'''
+_SQL_INSERT_FINAL_REPORT = '''INSERT INTO final_reports (report_id, session_id, structure_id, report_data, word_count)
+    VALUES (?, ?, ?, ?, ?)'''
+_SQL_INSERT_USER_FEEDBACK = '''INSERT INTO user_feedback (feedback_id, session_id, report_id, rating, comments)
+    VALUES (?, ?, ?, ?, ?)'''
+_SQL_SELECT_SESSION = 'SELECT * FROM sessions WHERE session_id = ?'
+_SQL_SELECT_RESEARCH_QUERIES = 'SELECT * FROM research_queries WHERE session_id = ?'
+_SQL_SELECT_RESEARCH_STRUCTURES = 'SELECT * FROM research_structure WHERE session_id = ?'
+_SQL_SELECT_WORKER_RESULTS = 'SELECT * FROM worker_results WHERE session_id = ?'
+_SQL_SELECT_FINAL_REPORTS = 'SELECT * FROM final_reports WHERE session_id = ?'
+_SQL_SELECT_USER_SESSIONS = '''SELECT session_id, created_at, last_accessed, status
+    FROM sessions
+    WHERE user_id = ?
+    ORDER BY last_accessed DESC
+    LIMIT ?'''
+_SQL_UPDATE_SESSION_ACCESS = '''UPDATE sessions
+    SET last_accessed = CURRENT_TIMESTAMP
+    WHERE session_id = ?'''
+_SQL_DELETE_OLD_SESSIONS = '''DELETE FROM sessions
+    WHERE last_accessed < datetime('now', ?)'''
+#child rows are deleted explicitly because databases created before ON DELETE CASCADE don't cascade
+_SQL_DELETE_OLD_SESSION_CHILDREN = [
+    f'''DELETE FROM {table}
+    WHERE session_id IN (SELECT session_id FROM sessions WHERE last_accessed < datetime('now', ?))'''
+    for table in ('user_feedback', 'final_reports', 'worker_results', 'research_structure', 'research_queries')
+]
+
+
+def _optimize_and_close(conn):
+    """Refresh query planner statistics, then close the connection"""
+    try:
+        conn.execute('PRAGMA optimize')
+    finally:
+        conn.close()
+
+
 class ResearchDatabase:
+    WORD_REGEX = re.compile(r"\S+")
+    #every zstd frame starts with this magic number; legacy rows hold plain JSON text
+    ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+    ZSTD_LEVEL = 6
+
     def __init__(self, db_path="Research.db"):
         self.db_path = db_path
+        #one long-lived connection shared by every method (autocommit), guarded by a lock
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None, cached_statements=512)
+        self._lock = threading.Lock()
+        #runs PRAGMA optimize and closes the connection on close(), garbage collection or interpreter exit
+        self._finalizer = weakref.finalize(self, _optimize_and_close, self._conn)
+        #zstd (de)compressor objects aren't thread-safe, so keep one pair per thread
+        self._codecs = threading.local()
         self._setup()
 
-    
+    @contextmanager
+    def _cursor(self):
+        """Yield a cursor on the shared connection while holding the lock"""
+        with self._lock:
+            cursor = self._conn.cursor()
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+
+    @contextmanager
+    def _transaction(self):
+        """Yield a cursor inside an explicit BEGIN/COMMIT, rolling back on error"""
+        with self._cursor() as cursor:
+            cursor.execute('BEGIN')
+            try:
+                yield cursor
+            except Exception:
+                self._conn.rollback()
+                raise
+            self._conn.commit()
+
+    def _dump_payload(self, obj) -> bytes:
+        """Serialize a large JSON payload and zstd-compress it for BLOB storage"""
+        if not hasattr(self._codecs, 'compressor'):
+            self._codecs.compressor = zstd.ZstdCompressor(level=self.ZSTD_LEVEL)
+        return self._codecs.compressor.compress(orjson.dumps(obj))
+
+    def _load_payload(self, value):
+        """Return the JSON text of a payload column, decompressing it if it was stored as zstd"""
+        if not isinstance(value, bytes) or not value.startswith(self.ZSTD_MAGIC):
+            return value
+        if not hasattr(self._codecs, 'decompressor'):
+            self._codecs.decompressor = zstd.ZstdDecompressor()
+        return self._codecs.decompressor.decompress(value).decode()
+
+    def close(self):
+        """Close the shared connection"""
+        with self._lock:
+            self._finalizer()
 
     def _setup(self):
         """Initialize the databse with all the necessary tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        #session table
-        cursor.execute('''CREATE TABLE IF NOT EXISTS sessions(
-                       session_id TEXT PRIMARY KEY,
-                user_id TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                last_accessed TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                status TEXT DEFAULT 'active',
-                metadata TEXT  -- JSON field for additional session data
-                       )''')
-        #research queries table
-        cursor.execute('''CREATE TABLE IF NOT EXISTS research_queries(
-                query_id TEXT PRIMARY KEY,
-                session_id TEXT,
-                original_query TEXT NOT NULL,
-                generated_queries TEXT,  -- JSON array of generated queries
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (session_id) REFERENCES sessions (session_id))''')
-
-        #Research structure table
-        cursor.execute('''CREATE TABLE IF NOT EXISTS research_structure(
-                      structure_id TEXT PRIMARY KEY,
-                query_id TEXT,
-                session_id TEXT,
-                structure_data TEXT,  -- JSON of the organized search queries
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (query_id) REFERENCES research_queries (query_id),
-                FOREIGN KEY (session_id) REFERENCES sessions (session_id))''')
-        #worker results
-        cursor.execute(''' CREATE TABLE IF NOT EXISTS worker_results(
-                       result_id TEXT PRIMARY KEY,
-                structure_id TEXT,
-                session_id TEXT,
-                worker_type TEXT,  -- 'introduction', 'background', 'research_findings', 'application', 'summary'
-                queries TEXT,  -- JSON array of queries processed
-                raw_summaries TEXT,  -- JSON array of raw summaries
-                compiled_result TEXT,  -- Final compiled result
-                processing_time REAL,  -- Time taken to process
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (structure_id) REFERENCES research_structures (structure_id),
-                FOREIGN KEY (session_id) REFERENCES sessions (session_id))''')
-        
-         # Final reports table - stores the complete research reports
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS final_reports (
-                report_id TEXT PRIMARY KEY,
-                session_id TEXT,
-                structure_id TEXT,
-                report_data TEXT,  -- JSON of the complete report
-                word_count INTEGER,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (session_id) REFERENCES sessions (session_id),
-                FOREIGN KEY (structure_id) REFERENCES research_structures (structure_id)
-            )
-        ''')
-        #user feedback table
-        cursor.execute('''CREATE TABLE IF NOT EXISTS user_feedback(feedback_id TEXT PRIMARY KEY,
-                session_id TEXT,
-                report_id TEXT,
-                rating INTEGER,  -- 1-5 rating
-                comments TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (session_id) REFERENCES sessions (session_id),
-                FOREIGN KEY (report_id) REFERENCES final_reports (report_id))''')
-
-        #create indexes for better performance
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_sessions_user_id on sessions (user_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_sessions_created_at on sessions (created_at)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_research_queries_session_id on research_queries (session_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_worker_results_sessions_id on worker_results (session_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_final_reports_session_id on final_reports (session_id)')
-        
-        conn.commit()
-        conn.close()
+        with self._cursor() as cursor:
+            #WAL is persisted in the database file, so it only has to be set once here.
+            #in-memory databases can't use WAL, so skip the journal pragmas for them
+            if self.db_path != ":memory:":
+                cursor.execute('PRAGMA journal_mode=WAL')
+                cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.execute('PRAGMA temp_store=MEMORY')
+            cursor.execute('PRAGMA cache_size=-64000')
+            cursor.execute('PRAGMA mmap_size=268435456')
+
+            #session table
+            cursor.execute('''CREATE TABLE IF NOT EXISTS sessions(
+                           session_id TEXT PRIMARY KEY,
+                    user_id TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    last_accessed TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    status TEXT DEFAULT 'active',
+                    metadata TEXT  -- JSON field for additional session data
+                           )''')
+            #research queries table
+            cursor.execute('''CREATE TABLE IF NOT EXISTS research_queries(
+                    query_id TEXT PRIMARY KEY,
+                    session_id TEXT,
+                    original_query TEXT NOT NULL,
+                    generated_queries TEXT,  -- JSON array of generated queries
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (session_id) REFERENCES sessions (session_id) ON DELETE CASCADE)''')
+
+            #Research structure table
+            cursor.execute('''CREATE TABLE IF NOT EXISTS research_structure(
+                          structure_id TEXT PRIMARY KEY,
+                    query_id TEXT,
+                    session_id TEXT,
+                    structure_data TEXT,  -- JSON of the organized search queries
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (query_id) REFERENCES research_queries (query_id) ON DELETE CASCADE,
+                    FOREIGN KEY (session_id) REFERENCES sessions (session_id) ON DELETE CASCADE)''')
+            #worker results
+            cursor.execute(''' CREATE TABLE IF NOT EXISTS worker_results(
+                           result_id TEXT PRIMARY KEY,
+                    structure_id TEXT,
+                    session_id TEXT,
+                    worker_type TEXT,  -- 'introduction', 'background', 'research_findings', 'application', 'summary'
+                    queries TEXT,  -- JSON array of queries processed
+                    raw_summaries BLOB,  -- zstd-compressed JSON array of raw summaries
+                    compiled_result TEXT,  -- Final compiled result
+                    processing_time REAL,  -- Time taken to process
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (structure_id) REFERENCES research_structure (structure_id) ON DELETE CASCADE,
+                    FOREIGN KEY (session_id) REFERENCES sessions (session_id) ON DELETE CASCADE)''')
+
+             # Final reports table - stores the complete research reports
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS final_reports (
+                    report_id TEXT PRIMARY KEY,
+                    session_id TEXT,
+                    structure_id TEXT,
+                    report_data BLOB,  -- zstd-compressed JSON of the complete report
+                    word_count INTEGER,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (session_id) REFERENCES sessions (session_id) ON DELETE CASCADE,
+                    FOREIGN KEY (structure_id) REFERENCES research_structure (structure_id) ON DELETE CASCADE
+                )
+            ''')
+            #user feedback table
+            cursor.execute('''CREATE TABLE IF NOT EXISTS user_feedback(feedback_id TEXT PRIMARY KEY,
+                    session_id TEXT,
+                    report_id TEXT,
+                    rating INTEGER,  -- 1-5 rating
+                    comments TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (session_id) REFERENCES sessions (session_id) ON DELETE CASCADE,
+                    FOREIGN KEY (report_id) REFERENCES final_reports (report_id) ON DELETE CASCADE)''')
+
+            #create indexes for better performance
+            #idx_sessions_user_last serves user_id lookups too, so the single-column index is redundant
+            cursor.execute('DROP INDEX IF EXISTS idx_sessions_user_id')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_sessions_user_last on sessions (user_id, last_accessed DESC)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_sessions_created_at on sessions (created_at)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_sessions_last_accessed on sessions (last_accessed)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_research_queries_session_id on research_queries (session_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_research_structure_session_id on research_structure (session_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_worker_results_sessions_id on worker_results (session_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_final_reports_session_id on final_reports (session_id)')
+
+            #databases created before the cascade schema reference a missing research_structures table,
+            #so only enforce foreign keys when every referenced table exists
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+            tables = {row[0] for row in cursor.fetchall()}
+            referenced = set()
+            for table in tables:
+                cursor.execute(f'PRAGMA foreign_key_list("{table}")')
+                referenced.update(row[2] for row in cursor.fetchall())
+            if referenced <= tables:
+                cursor.execute('PRAGMA foreign_keys=ON')
 
     def create_session(self, user_id: str = None, metadata: Dict = None):
         session_id = str(uuid.uuid4())
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''INSERT INTO sessions (session_id, user_id, metadata)
-            VALUES (?, ?, ?)
-        ''', (session_id, user_id, json.dumps(metadata) if metadata else None))
-        conn.commit()
-        conn.close()
+        with self._cursor() as cursor:
+            cursor.execute(_SQL_INSERT_SESSION, (session_id, user_id, orjson.dumps(metadata).decode() if metadata else None))
         return session_id
 
     def save_research_queries(self, session_id: str, original_query: str, generated_queries: List[str]) -> str:
         """Save the original query and the generated mutiple queries"""
-        query_id = str(uuid.uuid4())
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''INSERT INTO research_queries(query_id, session_id, original_query, generated_queries)
-            VALUES (?, ?, ?, ?)
-        ''', (query_id, session_id, original_query, json.dumps(generated_queries)))
-        conn.commit()
-        conn.close()
-        return query_id
+        return self.save_research_queries_bulk([(session_id, original_query, generated_queries)])[0]
+
+    def save_research_queries_bulk(self, rows: List[tuple]) -> List[str]:
+        """Save many (session_id, original_query, generated_queries) rows in a single transaction"""
+        query_ids = [str(uuid.uuid4()) for _ in rows]
+        params = [(query_id, session_id, original_query, orjson.dumps(generated_queries).decode())
+                  for query_id, (session_id, original_query, generated_queries) in zip(query_ids, rows)]
+        with self._transaction() as cursor:
+            cursor.executemany(_SQL_INSERT_RESEARCH_QUERY, params)
+        return query_ids
 
     def save_research_structure(self, query_id: str, session_id: str, structure_data: Dict) -> str:
         """save the organized research structure"""
 
         structure_id = str(uuid.uuid4())
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''INSERT INTO research_structure(structure_id, query_id, session_id, structure_data)
-            VALUES (?, ?, ?, ?)
-        ''', (structure_id, query_id, session_id, json.dumps(structure_data)))
-
-        conn.commit()
-        conn.close()
+        with self._cursor() as cursor:
+            cursor.execute(_SQL_INSERT_RESEARCH_STRUCTURE, (structure_id, query_id, session_id, orjson.dumps(structure_data).decode()))
         return structure_id
 
-    def save_worker_result(self, structure_id: str, session_id: str, worker_type: str, 
-                          queries: List[str], raw_summaries: List[str], 
+    def save_worker_result(self, structure_id: str, session_id: str, worker_type: str,
+                          queries: List[str], raw_summaries: List[str],
                           compiled_result: str, processing_time: float) -> str:
         """Save individual worker results"""
-        result_id = str(uuid.uuid4())
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO worker_results 
-            (result_id, structure_id, session_id, worker_type, queries, raw_summaries, compiled_result, processing_time)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (result_id, structure_id, session_id, worker_type, 
-              json.dumps(queries), json.dumps(raw_summaries), compiled_result, processing_time))
-        
-        conn.commit()
-        conn.close()
-        return result_id
+        return self.save_worker_results_bulk([(structure_id, session_id, worker_type, queries,
+                                               raw_summaries, compiled_result, processing_time)])[0]
+
+    def save_worker_results_bulk(self, rows: List[tuple]) -> List[str]:
+        """Save many worker results in a single transaction
+
+        Each row is (structure_id, session_id, worker_type, queries, raw_summaries, compiled_result, processing_time)
+        """
+        result_ids = [str(uuid.uuid4()) for _ in rows]
+        params = [(result_id, structure_id, session_id, worker_type,
+                   orjson.dumps(queries).decode(), self._dump_payload(raw_summaries), compiled_result, processing_time)
+                  for result_id, (structure_id, session_id, worker_type, queries, raw_summaries,
+                                  compiled_result, processing_time) in zip(result_ids, rows)]
+        with self._transaction() as cursor:
+            cursor.executemany(_SQL_INSERT_WORKER_RESULT, params)
+        return result_ids
 
     def save_final_report(self, session_id: str, structure_id: str, report_data: Dict) -> str:
         """Save the final compiled report"""
         report_id = str(uuid.uuid4())
-        
-        # Calculate word count
-        word_count = 0
-        for section_content in report_data.values():
-            if isinstance(section_content, str):
-                word_count += len(section_content.split())
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO final_reports (report_id, session_id, structure_id, report_data, word_count)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (report_id, session_id, structure_id, json.dumps(report_data), word_count))
-        
-        conn.commit()
-        conn.close()
+
+        # Calculate word count by counting matches rather than building word lists
+        word_count = sum(sum(1 for _ in self.WORD_REGEX.finditer(section_content))
+                         for section_content in report_data.values() if isinstance(section_content, str))
+
+        with self._cursor() as cursor:
+            cursor.execute(_SQL_INSERT_FINAL_REPORT, (report_id, session_id, structure_id, self._dump_payload(report_data), word_count))
         return report_id
 
 
     def get_session_data(self, session_id:str) -> Dict:
         """retrieve all data for a session"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._cursor() as cursor:
+            #get session info
+            cursor.execute(_SQL_SELECT_SESSION, (session_id,))
+            session = cursor.fetchone()
 
-        #get session info
-        cursor.execute('SELECT * FROM sessions WHERE session_id = ?', (session_id,))
-        session = cursor.fetchone()
+            #get research queries
+            cursor.execute(_SQL_SELECT_RESEARCH_QUERIES, (session_id,))
+            queries = cursor.fetchall()
 
-        #get research queries
-        cursor.execute('SELECT * FROM research_queries WHERE session_id = ?', (session_id,))
-        queries = cursor.fetchall()
+            #get research structure
+            cursor.execute(_SQL_SELECT_RESEARCH_STRUCTURES, (session_id,))
+            structures = cursor.fetchall()
 
-        #get research structure
-        cursor.execute('SELECT * FROM research_structure WHERE session_id = ?', (session_id,))
-        structures = cursor.fetchall()
+            #get worker results
+            cursor.execute(_SQL_SELECT_WORKER_RESULTS, (session_id,))
+            worker_results = [row[:5] + (self._load_payload(row[5]),) + row[6:] for row in cursor.fetchall()]
 
-        #get worker results
-        cursor.execute('SELECT * FROM worker_results WHERE session_id = ?', (session_id,))
-        worker_results = cursor.fetchone()
-
-        #get final report 
-        cursor.execute('SELECT * FROM sessions WHERE session_id = ?', (session_id,))
-        final_report = cursor.fetchall()
-
-        conn.close()
+            #get final report
+            cursor.execute(_SQL_SELECT_FINAL_REPORTS, (session_id,))
+            final_report = [row[:3] + (self._load_payload(row[3]),) + row[4:] for row in cursor.fetchall()]
 
         return {
             'session': session,
@@ -210,59 +306,32 @@ class ResearchDatabase:
 
     def update_session_access(self, session_id:str):
         """update the last accessed timestamp for the session"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''UPDATE sessions
-                       SET last_accessed = CURRENT_TIMESTAMP
-                       WHERE session_id = ?
-                       ''',(session_id,))
-
-
-        conn.commit()
-        conn.close()
+        with self._cursor() as cursor:
+            cursor.execute(_SQL_UPDATE_SESSION_ACCESS, (session_id,))
 
     def get_user_session(self, user_id:str, limit: int = 10) -> List:
         """Get current session for a user"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''SELECT session_id, created_at, last_accessed, status
-            FROM sessions 
-            WHERE user_id = ? 
-            ORDER BY last_accessed DESC 
-            LIMIT ?''',
-            (user_id, limit))
-        
-        sessions = cursor.fetchall()
-        conn.close()
+        with self._cursor() as cursor:
+            cursor.execute(_SQL_SELECT_USER_SESSIONS, (user_id, limit))
+
+            sessions = cursor.fetchall()
         return sessions
 
 
     def save_user_feedback(self, session_id: str, report_id: str, rating: int, comments: str = None) -> str:
         """save user feedback on a report"""
         feedback_id = str(uuid.uuid4())
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''INSERT INTO user_feedback (feedback_id, session_id, report_id, rating, comments)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (feedback_id, session_id, report_id, rating, comments))
-        conn.commit()
-        conn.close()
+        with self._cursor() as cursor:
+            cursor.execute(_SQL_INSERT_USER_FEEDBACK, (feedback_id, session_id, report_id, rating, comments))
         return feedback_id
 
 
     def cleanup_old_sessions(self, days: int = 40):
         """cleanup sessions older than specified days"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            DELETE FROM sessions 
-            WHERE last_accessed < datetime('now', '-{} days')
-        '''.format(days))
+        cutoff = (f'-{int(days)} days',)
+        with self._transaction() as cursor:
+            for statement in _SQL_DELETE_OLD_SESSION_CHILDREN:
+                cursor.execute(statement, cutoff)
+            cursor.execute(_SQL_DELETE_OLD_SESSIONS, cutoff)
 
-        conn.commit()
-        conn.commit()
 
-        
\ No newline at end of file
@@ -0,0 +1,107 @@
+# PDF rendering lives in its own module so the spawned pool workers only import ReportLab,
+# not the torch / sentence-transformers / langchain stack pulled in by source.utils
+import asyncio
+import datetime
+import multiprocessing
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+from reportlab.lib.units import inch
+from reportlab.lib.enums import TA_JUSTIFY
+
+_pdf_pool = None
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    global _pdf_pool
+    if _pdf_pool is None:
+        # spawn, not fork: by now the parent runs search, to_thread and torch threads, and forking those can deadlock
+        _pdf_pool = ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn"))
+    return _pdf_pool
+
+async def save_report_pdf_async(final_report: dict, query: str, output_path: str = None) -> str:
+    # ReportLab layout is CPU-bound, so build the PDF in a worker process instead of blocking the event loop
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_pdf_pool(), save_report_pdf, final_report, query, output_path)
+
+def save_report_pdf(final_report: dict, query: str, output_path: str = None) -> str:
+    # Generate a timestamp and unique suffix
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    unique_suffix = uuid.uuid4().hex[:6]
+
+    # Safe query for filename
+    safe_query = query.replace(" ", "_")
+
+    # Build filename
+    filename = f"Generated_research_for_{safe_query}_{timestamp}_{unique_suffix}.pdf"
+
+    # Define output path if not provided
+    if output_path is None:
+        downloads_folder = os.path.join(os.getcwd(), "downloads")
+        os.makedirs(downloads_folder, exist_ok=True)
+        doc_path = os.path.join(downloads_folder, filename)
+    else:
+        doc_path = output_path
+
+    # Setup document
+    doc = SimpleDocTemplate(doc_path, pagesize=A4, rightMargin=50, leftMargin=50, topMargin=50, bottomMargin=50)
+    styles = getSampleStyleSheet()
+    title_style = styles['Heading1']
+    section_title_style = styles['Heading2']
+    subheading_style = styles['Heading3']
+    paragraph_style = ParagraphStyle(
+        name="Justified", parent=styles["BodyText"],
+        fontSize=12, leading=18, alignment=TA_JUSTIFY
+    )
+
+    # Begin story
+    story = [Paragraph(f"Final Research Report: {query}", title_style), Spacer(1, 0.2 * inch)]
+
+    for section_title, content in final_report.items():
+        if section_title == "Sources Section":
+            continue
+
+        story.append(Paragraph(section_title, section_title_style))
+        story.append(Spacer(1, 0.1 * inch))
+
+        if hasattr(content, 'content'):
+            text = content.content
+        else:
+            text = str(content)
+
+        paragraphs = text.split("\n\n")
+        for para in paragraphs:
+            story.append(Paragraph(para.strip(), paragraph_style))
+            story.append(Spacer(1, 0.15 * inch))
+
+        story.append(Spacer(1, 0.3 * inch))
+
+    # Add sources
+    story.append(Paragraph("Sources", section_title_style))
+    story.append(Spacer(1, 0.1 * inch))
+
+    sources_list = final_report.get("Sources Section", [])
+    section_names = ["Introduction", "Background", "Research Findings", "Application", "Conclusion"]
+
+    # Validate sources_list
+    if not isinstance(sources_list, list) or any(not isinstance(s, list) for s in sources_list):
+        sources_list = [[] for _ in section_names]
+
+    while len(sources_list) < len(section_names):
+        sources_list.append([])
+
+    for section_name, urls in zip(section_names, sources_list):
+        story.append(Paragraph(f"{section_name} Sources:", subheading_style))
+        if urls:
+            for i, url in enumerate(urls, 1):
+                story.append(Paragraph(f"{i}. {url}", paragraph_style))
+        else:
+            story.append(Paragraph("No sources available.", paragraph_style))
+        story.append(Spacer(1, 0.2 * inch))
+
+    # Build PDF
+    doc.build(story)
+    print(f"PDF saved at: {doc_path}")
+    return doc_path
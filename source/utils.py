@@ -2,34 +2,78 @@
 import time
 import random
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import asyncio
 import os
 import re
-import json
-import uuid
-import datetime
+import threading
+import orjson
+import functools
+import hashlib
+import heapq
+import torch
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List
+import diskcache
 from duckduckgo_search import DDGS
 from googlesearch import search as google_search
 from langchain_core.runnables import RunnableLambda
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_groq import ChatGroq
 from newspaper import Article
-from bs4 import BeautifulSoup
-from sentence_transformers import SentenceTransformer, util
+from selectolax.lexbor import LexborHTMLParser
+from lxml import etree
+import fitz
+from sentence_transformers import SentenceTransformer
 from playwright.async_api import async_playwright
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.units import inch
-from reportlab.lib.enums import TA_JUSTIFY
+from source.report_pdf import save_report_pdf, save_report_pdf_async
+
+def disk_cached(namespace: str, ttl: int):
+    """Cache a method's non-empty result in self.cache, keyed on its namespace and arguments"""
+    def decorator(fn):
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(self, *args, **kwargs):
+                key = self._cache_key(namespace, args, kwargs)
+                cached = self.cache.get(key)
+                if cached is not None:
+                    return cached
+                result = await fn(self, *args, **kwargs)
+                if result:
+                    self.cache.set(key, result, expire=ttl)
+                return result
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            key = self._cache_key(namespace, args, kwargs)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+            result = fn(self, *args, **kwargs)
+            if result:
+                self.cache.set(key, result, expire=ttl)
+            return result
+        return wrapper
+    return decorator
 
 class ResearchHelpFunctions:
     SEMANTIC_SCHOLAR_API = "https://api.semanticscholar.org/graph/v1/paper/search"
     ARXIV_BASE_URL = "http://export.arxiv.org/api/query"
     MAX_WORD_LIMIT = 9000
     ARXIV_VALID_REGEX = re.compile(r"https?://arxiv\.org/abs/\d{4}\.\d{5}(v\d+)?")
+    ARXIV_ATOM_NS = {"a": "http://www.w3.org/2005/Atom"}
+    JSON_OBJECT_REGEX = re.compile(r"\{.*\}", re.DOTALL)
+    NON_ALNUM_REGEX = re.compile(r"[^a-zA-Z0-9 ]")
+    WORD_REGEX = re.compile(r"\S+")
     BRAVE_SEARCH_URL = "https://api.search.brave.com/res/v1/web/search"
+    EMBEDDING_CACHE_SIZE = 512
+    CACHE_DIR = "./.cache/research"
+    SEARCH_CACHE_TTL = 7 * 24 * 3600
+    ARTICLE_CACHE_TTL = 30 * 24 * 3600
+    EMBEDDING_BATCH_SIZE = 32
 
     def __init__(self):
         self.llm = ChatGroq(
@@ -37,22 +81,50 @@ class ResearchHelpFunctions:
             api_key=os.getenv("SUB_AGENT"),
             model="llama-3.3-70b-versatile"
         )
-        self.embedder = SentenceTransformer("all-MiniLM-L6-v2")
+        self.embedder = self._load_embedder()
+        self._embedding_cache = OrderedDict()  # hash(doc) -> normalized embedding, LRU order
         self.brave_api_key = os.getenv("BRAVE_SEARCH") 
-        self._last_brave_call_time = 0                                                                                                                                                                                    
+        self._last_brave_call_time = 0
+        self._brave_lock = threading.Lock()  # robust_search runs on worker threads, so pace Brave across them
+        self._search_pool = ThreadPoolExecutor(max_workers=10)
+        self.http = self._build_http_session()
+        self.cache = diskcache.Cache(self.CACHE_DIR, size_limit=2**30)
+
+    @staticmethod
+    def _cache_key(*parts) -> str:
+        return hashlib.sha1(orjson.dumps(parts)).hexdigest()
+
+    @staticmethod
+    def _build_http_session() -> requests.Session:
+        # One keep-alive session so repeat calls to the same host skip the TCP/TLS handshake
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=Retry(total=2, backoff_factor=0.3))
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"User-Agent": "Mozilla/5.0"})
+        return session
+
+    @staticmethod
+    def _load_embedder() -> SentenceTransformer:
+        embedder = SentenceTransformer("all-MiniLM-L6-v2")
+        if torch.cuda.is_available():
+            # fp16 halves the bytes moved per embedding on GPU
+            return embedder.half()
+        # On CPU, int8 dynamic quantization of the Linear layers gives the same effect
+        return torch.quantization.quantize_dynamic(embedder, {torch.nn.Linear}, dtype=torch.qint8)
 
     def extract_search_queries(self, raw_text: str) -> dict:
         think_end_tag = '</think>'
         if think_end_tag in raw_text:
             raw_text = raw_text.split(think_end_tag, 1)[-1].strip()
 
-        json_match = re.search(r'\{.*\}', raw_text, re.DOTALL)
+        json_match = self.JSON_OBJECT_REGEX.search(raw_text)
         if not json_match:
             raise ValueError("Could not find a complete JSON object in the response.")
 
         try:
-            data = json.loads(json_match.group())
-        except json.JSONDecodeError as e:
+            data = orjson.loads(json_match.group())
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON: {e}")
 
         if "organizedSearchQueries" not in data:
@@ -71,12 +143,13 @@ class ResearchHelpFunctions:
 
         return data
 
+    @disk_cached("brave", ttl=SEARCH_CACHE_TTL)
     def brave_search(self, query):
-        now = time.time()
-        elapsed = now - self._last_brave_call_time
-        if elapsed < 1.0:
-            time.sleep(1.0 - elapsed)  # Wait to respect 1 request/sec
-        self._last_brave_call_time = time.time()
+        with self._brave_lock:
+            wait = self._last_brave_call_time + 1.0 - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)  # Wait to respect 1 request/sec
+            self._last_brave_call_time = time.monotonic()
 
         url = self.BRAVE_SEARCH_URL
         headers = {
@@ -88,7 +161,7 @@ class ResearchHelpFunctions:
             "count": 5,
         }
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.http.get(url, headers=headers, params=params, timeout=10)
             response.raise_for_status()
             results = response.json()
             if "web" in results and "results" in results["web"]:
@@ -102,26 +175,26 @@ class ResearchHelpFunctions:
 
 
 
+    @disk_cached("arxiv", ttl=SEARCH_CACHE_TTL)
     def search_arvix(self, query: str, max_results: int = 3) -> List[str]:
         try:
             params = {"search_query": f"all:{query}", "start": 0, "max_results": max_results}
-            response = requests.get(self.ARXIV_BASE_URL, params=params, timeout=10)
+            response = self.http.get(self.ARXIV_BASE_URL, params=params, timeout=10)
             response.raise_for_status()
-            entries = response.text.split("<entry>")
             links = []
 
-            query_keywords = set(re.sub(r"[^a-zA-Z0-9 ]", "", query).lower().split())
+            query_keywords = set(self.NON_ALNUM_REGEX.sub("", query).lower().split())
 
-            for entry in entries:
-                if "<id>" in entry and "<title>" in entry:
-                    raw_url = entry.split("<id>")[1].split("</id>")[0].replace("/api/", "/abs/")
-                    title = entry.split("<title>")[1].split("</title>")[0].lower()
+            root = etree.fromstring(response.content)
+            for entry in root.iterfind("a:entry", self.ARXIV_ATOM_NS):
+                raw_url = entry.findtext("a:id", "", namespaces=self.ARXIV_ATOM_NS).replace("/api/", "/abs/")
+                title = entry.findtext("a:title", "", namespaces=self.ARXIV_ATOM_NS).lower()
 
-                    # Check if arXiv URL is valid and title is loosely relevant
-                    if self.ARXIV_VALID_REGEX.match(raw_url):
-                        title_words = set(re.sub(r"[^a-zA-Z0-9 ]", "", title).split())
-                        if len(query_keywords & title_words) > 0:  # simple intersection logic
-                            links.append(raw_url)
+                # Check if arXiv URL is valid and title is loosely relevant
+                if self.ARXIV_VALID_REGEX.match(raw_url):
+                    title_words = set(self.NON_ALNUM_REGEX.sub("", title).split())
+                    if len(query_keywords & title_words) > 0:  # simple intersection logic
+                        links.append(raw_url)
 
             return links
         except Exception as e:
@@ -129,10 +202,11 @@ class ResearchHelpFunctions:
             return []
 
 
+    @disk_cached("semantic_scholar", ttl=SEARCH_CACHE_TTL)
     def semantic_search_scholar(self, query: str, max_results: int = 3) -> List[str]:
         try:
             params = {"query": query, "limit": max_results, "fields": "title,url"}
-            response = requests.get(self.SEMANTIC_SCHOLAR_API, params=params, timeout=10)
+            response = self.http.get(self.SEMANTIC_SCHOLAR_API, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
             return [paper["url"] for paper in data.get("data", []) if "url" in paper]
@@ -140,6 +214,7 @@ class ResearchHelpFunctions:
             print(f"[Semantic Scholar] Failed: {e}")
             return []
 
+    @disk_cached("duckduckgo", ttl=SEARCH_CACHE_TTL)
     def search_duckduckgo(self, query: str, num_results: int = 3, retries: int = 3, delay_range=(7, 15)) -> List[str]:
         for attempt in range(retries):
             try:
@@ -151,6 +226,7 @@ class ResearchHelpFunctions:
                 print(f"[DuckDuckGo Attempt {attempt + 1}] Failed: {e}")
         return []
 
+    @disk_cached("google", ttl=SEARCH_CACHE_TTL)
     def search_google(self, query: str, num_results: int = 3) -> List[str]:
         try:
             return list(google_search(query, num_results=num_results, lang="en"))
@@ -158,49 +234,100 @@ class ResearchHelpFunctions:
             print(f"[Google Search] Failed: {e}")
             return []
 
-    def robust_search(self, query: str, num_results: int = 3) -> List[str]:
+    def _filter_search_urls(self, new_urls: List[str]) -> List[str]:
         urls = []
-        search_functions = [
-            lambda q: self.brave_search(q),
-            lambda q: self.search_arvix(q, num_results),
-            lambda q: self.semantic_search_scholar(q, num_results),
-            lambda q: self.search_duckduckgo(q, num_results),
-            lambda q: self.search_google(q, num_results)
-        ]
-        for fn in search_functions:
+        for url in new_urls:
+            if "arxiv.org/abs/" in url and not self.ARXIV_VALID_REGEX.match(url):
+                print(f"[Malformed Arxiv URL] {url} — retrying with another engine")
+                continue
+            urls.append(url)
+        return urls
+
+    def robust_search(self, query: str, num_results: int = 3) -> List[str]:
+        # The REST APIs are queried at once and the first one with usable links wins
+        api_functions = {
+            "Brave Search": lambda q: self.brave_search(q),
+            "arXiv": lambda q: self.search_arvix(q, num_results),
+            "Semantic Scholar": lambda q: self.semantic_search_scholar(q, num_results)
+        }
+        futures = {self._search_pool.submit(fn, query): name for name, fn in api_functions.items()}
+        for future in as_completed(futures):
             try:
-                new_urls = fn(query)
-                for url in new_urls:
-                    if "arxiv.org/abs/" in url and not self.ARXIV_VALID_REGEX.match(url):
-                        print(f"[Malformed Arxiv URL] {url} — retrying with another engine")
-                        continue
-                    urls.append(url)
-                if urls:
-                    time.sleep(5)
-                    break
+                urls = self._filter_search_urls(future.result())
             except Exception as e:
-                print(f"[{fn.__name__ if hasattr(fn, '__name__') else 'search_function'}] Unexpected failure: {e}")
-        return urls
+                print(f"[{futures[future]}] Unexpected failure: {e}")
+                continue
+            if urls:
+                return urls
 
-    async def fetch_full_text(self, url: str, timeout: int = 10) -> str:
-        if "arxiv.org/abs/" in url and not self.ARXIV_VALID_REGEX.match(url):
-            print(f"[Invalid Arxiv URL Skipped] {url}")
-            return ""
+        # DuckDuckGo and Google pace themselves to avoid rate bans, so only fall back to them one at a time
+        scraper_functions = {
+            "DuckDuckGo": lambda q: self.search_duckduckgo(q, num_results),
+            "Google Search": lambda q: self.search_google(q, num_results)
+        }
+        for name, fn in scraper_functions.items():
+            try:
+                urls = self._filter_search_urls(fn(query))
+            except Exception as e:
+                print(f"[{name}] Unexpected failure: {e}")
+                continue
+            if urls:
+                return urls
+        return []
+
+    @staticmethod
+    def _extract_paragraphs(html: str) -> str:
+        # selectolax's Lexbor backend (C parser) is much faster than BeautifulSoup's html.parser on large pages
+        texts = (node.text() for node in LexborHTMLParser(html).css("p"))
+        return "\n".join(text for text in texts if text.strip())
 
+    def _fetch_html_text(self, url: str, timeout: int):
+        # None means the page could not be fetched and the next fallback should be tried
         headers = {"User-Agent": "Mozilla/5.0", "Accept": "text/html"}
+        response = self.http.get(url, headers=headers, timeout=timeout)
+        if response.status_code != 200:
+            return None
+        return self._extract_paragraphs(response.text)
+
+    @staticmethod
+    def _fetch_article_text(url: str) -> str:
+        article = Article(url)
+        article.download()
+        article.parse()
+        return article.text
+
+    def _fetch_arxiv_pdf_text(self, url: str, timeout: int) -> str:
+        # Build from the matched abs link only, so query strings or trailing slashes don't end up in the PDF path
+        abs_url = self.ARXIV_VALID_REGEX.match(url).group(0)
+        pdf_url = abs_url.replace("/abs/", "/pdf/") + ".pdf"
+        response = self.http.get(pdf_url, timeout=timeout)
+        response.raise_for_status()
+        with fitz.open(stream=response.content, filetype="pdf") as doc:
+            return "\n".join(page.get_text() for page in doc)
+
+    @disk_cached("full_text", ttl=ARTICLE_CACHE_TTL)
+    async def fetch_full_text(self, url: str, timeout: int = 10) -> str:
+        if "arxiv.org/abs/" in url:
+            if not self.ARXIV_VALID_REGEX.match(url):
+                print(f"[Invalid Arxiv URL Skipped] {url}")
+                return ""
+            # The abs page is only metadata, so go straight to the paper PDF
+            try:
+                return await asyncio.to_thread(self._fetch_arxiv_pdf_text, url, timeout)
+            except Exception as e:
+                print(f"[arXiv PDF] Failed: {e}")
+                return ""
+
+        # The requests and newspaper3k steps block, so run them in threads to let other fetches proceed
         try:
-            response = requests.get(url, headers=headers, timeout=timeout)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, "html.parser")
-                return "\n".join(p.get_text() for p in soup.find_all("p") if p.get_text().strip())
+            text = await asyncio.to_thread(self._fetch_html_text, url, timeout)
+            if text is not None:
+                return text
         except Exception as e:
             print(f"[Requests] Error: {e}")
 
         try:
-            article = Article(url)
-            article.download()
-            article.parse()
-            return article.text
+            return await asyncio.to_thread(self._fetch_article_text, url)
         except Exception as e:
             print(f"[newspaper3k] Failed: {e}")
 
@@ -210,33 +337,67 @@ class ResearchHelpFunctions:
                 page = await browser.new_page()
                 await page.goto(url)
                 content = await page.content()
-                soup = BeautifulSoup(content, "html.parser")
                 await browser.close()
-                return "\n".join(p.get_text() for p in soup.find_all("p") if p.get_text().strip())
+                return self._extract_paragraphs(content)
         except Exception as e:
             print(f"[Playwright] Failed: {e}")
         return ""
 
     def truncate_context(self, text: str) -> str:
-        words = text.split()
-        return " ".join(words[:self.MAX_WORD_LIMIT]) + ("\n\n...[TRUNCATED]" if len(words) > self.MAX_WORD_LIMIT else "")
+        # Walk words lazily and cut at the end of the last allowed one instead of splitting the whole text
+        words = self.WORD_REGEX.finditer(text)
+        last_end = 0
+        for _, match in zip(range(self.MAX_WORD_LIMIT), words):
+            last_end = match.end()
+        if next(words, None) is None:
+            return text
+        return text[:last_end] + "\n\n...[TRUNCATED]"
+
+    def _encode_docs(self, docs: List[str]) -> torch.Tensor:
+        # Only encode docs missing from the LRU cache, all in one batched forward pass
+        keys = [hash(doc) for doc in docs]
+        missing = {}
+        for key, doc in zip(keys, docs):
+            if key in self._embedding_cache:
+                self._embedding_cache.move_to_end(key)
+            else:
+                missing[key] = doc
+
+        if missing:
+            embeddings = self.embedder.encode(
+                list(missing.values()),
+                batch_size=min(self.EMBEDDING_BATCH_SIZE, len(missing)),
+                convert_to_tensor=True,
+                normalize_embeddings=True
+            )
+            for key, emb in zip(missing, embeddings):
+                self._embedding_cache[key] = emb
+
+        doc_embs = torch.stack([self._embedding_cache[key] for key in keys])
+        while len(self._embedding_cache) > self.EMBEDDING_CACHE_SIZE:
+            self._embedding_cache.popitem(last=False)
+        return doc_embs
 
     def rank_and_select_contexts(self, query: str, docs: List[str]) -> str:
-        query_emb = self.embedder.encode(query, convert_to_tensor=True)
-        ranked = []
-        for doc in docs:
-            doc_emb = self.embedder.encode(doc, convert_to_tensor=True)
-            score = util.cos_sim(query_emb, doc_emb).item()
-            ranked.append((score, doc))
-        ranked.sort(reverse=True, key=lambda x: x[0])
+        if not docs:
+            return ""
+
+        query_emb = self.embedder.encode(query, convert_to_tensor=True, normalize_embeddings=True)
+        doc_embs = self._encode_docs(docs)
+        # Embeddings are normalized, so the dot product is the cosine similarity
+        scores = (doc_embs @ query_emb).cpu().tolist()
+        # Heapify is O(N); docs are popped best-first only until the word budget runs out
+        ranked = [(-score, i) for i, score in enumerate(scores)]
+        heapq.heapify(ranked)
 
         selected, total_words = [], 0
-        for _, doc in ranked:
-            words = doc.split()
-            if total_words + len(words) > self.MAX_WORD_LIMIT:
+        while ranked:
+            _, i = heapq.heappop(ranked)
+            word_count = sum(1 for _ in self.WORD_REGEX.finditer(docs[i]))
+            if total_words + word_count > self.MAX_WORD_LIMIT:
                 break
-            selected.append(doc)
-            total_words += len(words)
+            selected.append(docs[i])
+            total_words += word_count
 
         return "\n\n".join(selected)
 
@@ -254,21 +415,22 @@ class ResearchHelpFunctions:
         )
 
         async def sub_agent_fn(query: str) -> dict:
-            urls = self.robust_search(query)
+            # robust_search blocks on HTTP, so keep it off the event loop for the other sub-agents
+            urls = await asyncio.to_thread(self.robust_search, query)
             if not urls:
                 return {"result": f"{name}: No useful links found for query: {query}", "sources": []}
 
             contents = []
             sites = []
-            for url in urls[:2]:
-                try:
-                    content = await self.fetch_full_text(url)
-                    if content:
-                        contents.append(content)
-                        sites.append(url)
-                    await asyncio.sleep(3)
-                except Exception as e:
-                    print(f"[Scrape Fail] {url}: {e}")
+            # The scrape targets are on different hosts, so fetch them concurrently
+            targets = urls[:2]
+            results = await asyncio.gather(*(self.fetch_full_text(url) for url in targets), return_exceptions=True)
+            for url, content in zip(targets, results):
+                if isinstance(content, Exception):
+                    print(f"[Scrape Fail] {url}: {content}")
+                elif content:
+                    contents.append(content)
+                    sites.append(url)
 
             if not contents:
                 return {"result": f"{name}: No content scraped for: {query}", "sources": sites}
@@ -276,93 +438,23 @@ class ResearchHelpFunctions:
             full_context = self.rank_and_select_contexts(query, contents)
             safe_context = self.truncate_context(full_context)
 
-            try:
-                final_prompt = prompt.invoke({"name": name, "context": safe_context})
-                response = await self.llm.ainvoke(final_prompt)
-                answer = response.content if hasattr(response, "content") else str(response)
-            except Exception as e:
-                answer = f"{name}: LLM failed to respond due to: {e}"
+            llm_key = self._cache_key("llm", name, hashlib.sha1(safe_context.encode()).hexdigest())
+            answer = self.cache.get(llm_key)
+            if answer is None:
+                try:
+                    final_prompt = prompt.invoke({"name": name, "context": safe_context})
+                    response = await self.llm.ainvoke(final_prompt)
+                    answer = response.content if hasattr(response, "content") else str(response)
+                    self.cache.set(llm_key, answer, expire=self.ARTICLE_CACHE_TTL)
+                except Exception as e:
+                    answer = f"{name}: LLM failed to respond due to: {e}"
 
             return {"result": answer, "sources": sites}
 
         return RunnableLambda(sub_agent_fn)
 
-    def save_final_report_as_pdf(self, final_report: dict, query: str, output_path: str = None):
-        # Generate a timestamp and unique suffix
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        unique_suffix = uuid.uuid4().hex[:6]
-
-        # Safe query for filename
-        safe_query = query.replace(" ", "_")
-
-        # Build filename
-        filename = f"Generated_research_for_{safe_query}_{timestamp}_{unique_suffix}.pdf"
-
-        # Define output path if not provided
-        if output_path is None:
-            downloads_folder = os.path.join(os.getcwd(), "downloads")
-            os.makedirs(downloads_folder, exist_ok=True)
-            doc_path = os.path.join(downloads_folder, filename)
-        else:
-            doc_path = output_path
-
-        # Setup document
-        doc = SimpleDocTemplate(doc_path, pagesize=A4, rightMargin=50, leftMargin=50, topMargin=50, bottomMargin=50)
-        styles = getSampleStyleSheet()
-        title_style = styles['Heading1']
-        section_title_style = styles['Heading2']
-        subheading_style = styles['Heading3']
-        paragraph_style = ParagraphStyle(
-            name="Justified", parent=styles["BodyText"],
-            fontSize=12, leading=18, alignment=TA_JUSTIFY
-        )
-
-        # Begin story
-        story = [Paragraph(f"Final Research Report: {query}", title_style), Spacer(1, 0.2 * inch)]
-
-        for section_title, content in final_report.items():
-            if section_title == "Sources Section":
-                continue
-
-            story.append(Paragraph(section_title, section_title_style))
-            story.append(Spacer(1, 0.1 * inch))
-
-            if hasattr(content, 'content'):
-                text = content.content
-            else:
-                text = str(content)
-
-            paragraphs = text.split("\n\n")
-            for para in paragraphs:
-                story.append(Paragraph(para.strip(), paragraph_style))
-                story.append(Spacer(1, 0.15 * inch))
-
-            story.append(Spacer(1, 0.3 * inch))
-
-        # Add sources
-        story.append(Paragraph("Sources", section_title_style))
-        story.append(Spacer(1, 0.1 * inch))
-
-        sources_list = final_report.get("Sources Section", [])
-        section_names = ["Introduction", "Background", "Research Findings", "Application", "Conclusion"]
-
-        # Validate sources_list
-        if not isinstance(sources_list, list) or any(not isinstance(s, list) for s in sources_list):
-            sources_list = [[] for _ in section_names]
-
-        while len(sources_list) < len(section_names):
-            sources_list.append([])
-
-        for section_name, urls in zip(section_names, sources_list):
-            story.append(Paragraph(f"{section_name} Sources:", subheading_style))
-            if urls:
-                for i, url in enumerate(urls, 1):
-                    story.append(Paragraph(f"{i}. {url}", paragraph_style))
-            else:
-                story.append(Paragraph("No sources available.", paragraph_style))
-            story.append(Spacer(1, 0.2 * inch))
+    def save_final_report_as_pdf(self, final_report: dict, query: str, output_path: str = None) -> str:
+        return save_report_pdf(final_report, query, output_path)
 
-        # Build PDF
-        doc.build(story)
-        print(f"PDF saved at: {doc_path}")
-        
\ No newline at end of file
+    async def save_final_report_as_pdf_async(self, final_report: dict, query: str, output_path: str = None) -> str:
+        return await save_report_pdf_async(final_report, query, output_path)